@@ -5,22 +5,116 @@ Data processing module with various utilities for handling different data types.
 
 import json
 import asyncio
+from collections import deque
 from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 import re
 
+try:
+    import numpy as np  # Optional: vectorized number parsing and windowing
+except ImportError:
+    np = None
 
-class ProcessingStatus(Enum):
+try:
+    import numba  # Optional: JIT-compiled rolling-window kernel
+except ImportError:
+    numba = None
+
+try:
+    import aiohttp  # Optional: real HTTP fetching with a pooled session
+except ImportError:
+    aiohttp = None
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _rolling_stats(arr, window_size):
+        """Single-pass rolling (means, mins, maxs, sums) over an array.
+
+        Running sum plus monotonic index deques (preallocated arrays with
+        head/tail cursors), so the whole scan is O(len(arr))."""
+        n = window_size
+        m = arr.shape[0] - n + 1
+        means = np.empty(m)
+        mins = np.empty(m)
+        maxs = np.empty(m)
+        sums = np.empty(m)
+        min_idx = np.empty(arr.shape[0], np.int64)
+        max_idx = np.empty(arr.shape[0], np.int64)
+        min_head = min_tail = 0
+        max_head = max_tail = 0
+        total = 0.0
+
+        for i in range(arr.shape[0]):
+            value = arr[i]
+            total += value
+            if i >= n:
+                total -= arr[i - n]
+            if min_tail > min_head and min_idx[min_head] <= i - n:
+                min_head += 1
+            if max_tail > max_head and max_idx[max_head] <= i - n:
+                max_head += 1
+            while min_tail > min_head and arr[min_idx[min_tail - 1]] > value:
+                min_tail -= 1
+            min_idx[min_tail] = i
+            min_tail += 1
+            while max_tail > max_head and arr[max_idx[max_tail - 1]] < value:
+                max_tail -= 1
+            max_idx[max_tail] = i
+            max_tail += 1
+
+            if i >= n - 1:
+                j = i - n + 1
+                sums[j] = total
+                means[j] = total / n
+                mins[j] = arr[min_idx[min_head]]
+                maxs[j] = arr[max_idx[max_head]]
+
+        return means, mins, maxs, sums
+else:
+    _rolling_stats = None
+
+
+# Precompiled patterns (module-level so hot paths skip the re cache lookup)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_RE = re.compile(r'^\+?1?\d{10,14}$')
+_PHONE_STRIP = str.maketrans('', '', ' \t\n\r\v\f-()')
+_NUM_RE = re.compile(r'-?\d+\.?\d*')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_DOMAIN_RE = re.compile(r'https?://([^/]+)')
+
+
+def _extract_domain(url: str) -> Optional[str]:
+    """Extract the domain from a URL, bypassing the regex for common prefixes."""
+    for prefix in ('https://', 'http://'):
+        if url.startswith(prefix):
+            rest = url[len(prefix):]
+            slash = rest.find('/')
+            return rest if slash < 0 else rest[:slash]
+    match = _DOMAIN_RE.match(url)
+    return match.group(1) if match else None
+
+# Dispatch table for text operations (avoids a per-op branch chain)
+_TEXT_OPS = {
+    "lowercase": str.lower,
+    "uppercase": str.upper,
+    "strip": str.strip,
+    "remove_punctuation": lambda s: _PUNCT_RE.sub('', s),
+    "normalize_whitespace": lambda s: ' '.join(s.split()),
+}
+
+
+class ProcessingStatus(IntEnum):
     """Status of data processing operations."""
-    PENDING = "pending"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    FAILED = "failed"
+    PENDING = 0
+    IN_PROGRESS = 1
+    COMPLETED = 2
+    FAILED = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of a data processing operation."""
     status: ProcessingStatus
@@ -39,16 +133,14 @@ class DataValidator:
     @staticmethod
     def validate_email(email: str) -> bool:
         """Validate email address format."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
     
     @staticmethod
     def validate_phone(phone: str) -> bool:
         """Validate phone number format."""
         # Simple validation for US phone numbers
-        pattern = r'^\+?1?\d{10,14}$'
-        cleaned = re.sub(r'[\s\-\(\)]', '', phone)
-        return re.match(pattern, cleaned) is not None
+        cleaned = phone.translate(_PHONE_STRIP)
+        return _PHONE_RE.match(cleaned) is not None
     
     @staticmethod
     def validate_json(json_str: str) -> tuple[bool, Optional[Dict]]:
@@ -63,91 +155,145 @@ class DataValidator:
 class DataProcessor:
     """Main data processor with various transformation capabilities."""
     
-    def __init__(self, batch_size: int = 100):
+    def __init__(self, batch_size: int = 100, keep_errors: bool = False):
         self.batch_size = batch_size
+        self.keep_errors = keep_errors
         self._processed_count = 0
+        self._error_count = 0
         self._errors = []
-    
+        self._pipelines: Dict[tuple, tuple] = {}
+
     def process_text(self, text: str, operations: List[str]) -> str:
         """Apply a series of text operations."""
         result = text
-        
-        for op in operations:
-            if op == "lowercase":
-                result = result.lower()
-            elif op == "uppercase":
-                result = result.upper()
-            elif op == "strip":
-                result = result.strip()
-            elif op == "remove_punctuation":
-                result = re.sub(r'[^\w\s]', '', result)
-            elif op == "normalize_whitespace":
-                result = ' '.join(result.split())
-        
+
+        for func in self._compile_pipeline(tuple(operations)):
+            result = func(result)
+
         return result
+
+    def _compile_pipeline(self, op_names: tuple) -> tuple:
+        """Resolve operation names to callables once and cache the result."""
+        pipeline = self._pipelines.get(op_names)
+        if pipeline is None:
+            pipeline = tuple(_TEXT_OPS[op] for op in op_names if op in _TEXT_OPS)
+            self._pipelines[op_names] = pipeline
+        return pipeline
     
     def extract_numbers(self, text: str) -> List[float]:
         """Extract all numbers from text."""
         # Find integers and decimals
-        pattern = r'-?\d+\.?\d*'
-        numbers = re.findall(pattern, text)
+        numbers = _NUM_RE.findall(text)
+        if np is not None:
+            # Convert in C instead of one float() call per match
+            return np.fromiter(numbers, dtype=np.float64, count=len(numbers)).tolist()
         return [float(n) for n in numbers]
     
     def process_batch(self, items: List[Dict], processor_func) -> List[ProcessingResult]:
-        """Process items in batches."""
-        results = []
-        
-        for i in range(0, len(items), self.batch_size):
-            batch = items[i:i + self.batch_size]
-            
-            for item in batch:
-                try:
-                    processed = processor_func(item)
-                    results.append(ProcessingResult(
-                        status=ProcessingStatus.COMPLETED,
-                        data=processed
-                    ))
-                    self._processed_count += 1
-                except Exception as e:
-                    error_result = ProcessingResult(
-                        status=ProcessingStatus.FAILED,
-                        error=str(e)
-                    )
-                    results.append(error_result)
+        """Process a list of items, one result per item."""
+        # Preallocate and fill by index; one timestamp for the whole batch
+        results = [None] * len(items)
+        now = datetime.now()
+
+        for i, item in enumerate(items):
+            try:
+                processed = processor_func(item)
+                results[i] = ProcessingResult(
+                    status=ProcessingStatus.COMPLETED,
+                    data=processed,
+                    timestamp=now
+                )
+                self._processed_count += 1
+            except Exception as e:
+                error_result = ProcessingResult(
+                    status=ProcessingStatus.FAILED,
+                    error=str(e),
+                    timestamp=now
+                )
+                results[i] = error_result
+                self._error_count += 1
+                if self.keep_errors:
                     self._errors.append(error_result)
-        
+
         return results
+
+    def process_batch_vectorized(self, items: List[Dict], batch_func) -> List[ProcessingResult]:
+        """Process all items with a single call to batch_func(items).
+
+        For processors that can operate on the whole list at once (e.g.
+        NumPy-backed transforms), this avoids the per-item call overhead
+        of process_batch.
+        """
+        now = datetime.now()
+        try:
+            processed = batch_func(items)
+        except Exception as e:
+            error_result = ProcessingResult(
+                status=ProcessingStatus.FAILED,
+                error=str(e),
+                timestamp=now
+            )
+            self._error_count += 1
+            if self.keep_errors:
+                self._errors.append(error_result)
+            return [error_result]
+
+        self._processed_count += len(items)
+        return [ProcessingResult(status=ProcessingStatus.COMPLETED, data=p, timestamp=now)
+                for p in processed]
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get processing statistics."""
         return {
             "processed_count": self._processed_count,
-            "error_count": len(self._errors),
-            "success_rate": (self._processed_count - len(self._errors)) / self._processed_count if self._processed_count > 0 else 0
+            "error_count": self._error_count,
+            "success_rate": (self._processed_count - self._error_count) / self._processed_count if self._processed_count > 0 else 0
         }
 
 
 class AsyncDataProcessor:
-    """Asynchronous data processor for concurrent operations."""
-    
-    def __init__(self, max_concurrent: int = 10):
+    """Asynchronous data processor for concurrent operations.
+
+    Use as an async context manager to fetch URLs over a shared aiohttp
+    session (one pooled connector for all requests); without aiohttp, or
+    outside a context, processing falls back to offline URL parsing.
+    """
+
+    def __init__(self, max_concurrent: int = 10, simulate_delay: bool = False):
         self.max_concurrent = max_concurrent
+        self.simulate_delay = simulate_delay
         self._semaphore = asyncio.Semaphore(max_concurrent)
-    
+        self._session = None
+
+    async def __aenter__(self) -> 'AsyncDataProcessor':
+        if aiohttp is not None and self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrent))
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     async def process_url(self, url: str) -> ProcessingResult:
-        """Simulate processing a URL asynchronously."""
+        """Process a URL asynchronously."""
         async with self._semaphore:
             try:
-                # Simulate network request
-                await asyncio.sleep(0.1)
-                
-                # Extract domain
-                domain_match = re.match(r'https?://([^/]+)', url)
-                domain = domain_match.group(1) if domain_match else None
-                
+                data = {"url": url, "domain": _extract_domain(url)}
+
+                if self._session is not None:
+                    async with self._session.get(url) as response:
+                        body = await response.read()
+                        data["status"] = response.status
+                        data["content_length"] = len(body)
+                elif self.simulate_delay:
+                    # Simulate network request (demo/debug only)
+                    await asyncio.sleep(0.1)
+
                 return ProcessingResult(
                     status=ProcessingStatus.COMPLETED,
-                    data={"url": url, "domain": domain}
+                    data=data
                 )
             except Exception as e:
                 return ProcessingResult(
@@ -166,32 +312,124 @@ class StreamProcessor:
     
     def __init__(self, window_size: int = 10):
         self.window_size = window_size
-        self._buffer = []
-        self._window_stats = []
-    
+        self._window = deque(maxlen=window_size)
+        self._sum = 0
+        self._min_dq = deque()  # ascending candidates for the window min
+        self._max_dq = deque()  # descending candidates for the window max
+        # get_trend only reads the last 5 windows, so don't retain more
+        self._window_stats = deque(maxlen=5)
+
     def add_value(self, value: float) -> Optional[Dict[str, float]]:
-        """Add a value to the stream and return window statistics."""
-        self._buffer.append(value)
-        
-        if len(self._buffer) >= self.window_size:
-            window = self._buffer[-self.window_size:]
+        """Add a value to the stream and return window statistics.
+
+        Uses a running sum plus monotonic deques for min/max, so each
+        arrival costs O(1) amortized instead of rescanning the window.
+        """
+        if len(self._window) == self.window_size:
+            old = self._window[0]
+            self._sum -= old
+            if self._min_dq[0] == old:
+                self._min_dq.popleft()
+            if self._max_dq[0] == old:
+                self._max_dq.popleft()
+
+        self._window.append(value)
+        self._sum += value
+        while self._min_dq and self._min_dq[-1] > value:
+            self._min_dq.pop()
+        self._min_dq.append(value)
+        while self._max_dq and self._max_dq[-1] < value:
+            self._max_dq.pop()
+        self._max_dq.append(value)
+
+        if len(self._window) >= self.window_size:
             stats = {
-                "mean": sum(window) / len(window),
-                "min": min(window),
-                "max": max(window),
-                "sum": sum(window)
+                "mean": self._sum / self.window_size,
+                "min": self._min_dq[0],
+                "max": self._max_dq[0],
+                "sum": self._sum
             }
             self._window_stats.append(stats)
             return stats
-        
+
         return None
-    
+
+    def add_many(self, values: List[float]) -> List[Dict[str, float]]:
+        """Add a batch of values, returning stats for each completed window.
+
+        With NumPy available, all window statistics are computed in one
+        vectorized pass over the batch instead of value-at-a-time.
+        """
+        if np is None or len(values) < 2:
+            return [s for s in map(self.add_value, values) if s is not None]
+
+        n = self.window_size
+        tail = list(self._window)
+        arr = np.concatenate([
+            np.asarray(tail, dtype=np.float64),
+            np.asarray(values, dtype=np.float64),
+        ])
+
+        results = []
+        if len(arr) >= n:
+            windows = np.lib.stride_tricks.sliding_window_view(arr, n)
+            # Only windows that end on one of the new values
+            first = max(0, len(tail) - n + 1)
+            sums = windows.sum(axis=1)
+            mins = windows.min(axis=1)
+            maxs = windows.max(axis=1)
+            for j in range(first, len(windows)):
+                results.append({
+                    "mean": sums[j] / n,
+                    "min": mins[j],
+                    "max": maxs[j],
+                    "sum": sums[j]
+                })
+            self._window_stats.extend(results)
+
+        # Rebuild the streaming state from the window tail
+        self._window = deque(arr[-n:].tolist(), maxlen=n)
+        self._sum = sum(self._window)
+        self._min_dq.clear()
+        self._max_dq.clear()
+        for value in self._window:
+            while self._min_dq and self._min_dq[-1] > value:
+                self._min_dq.pop()
+            self._min_dq.append(value)
+            while self._max_dq and self._max_dq[-1] < value:
+                self._max_dq.pop()
+            self._max_dq.append(value)
+
+        return results
+
+    def process_array(self, values) -> tuple:
+        """Compute rolling (means, mins, maxs, sums) for a whole array.
+
+        Offline counterpart to add_value for post-hoc analysis; does not
+        touch the streaming state. Uses the Numba kernel when available.
+        """
+        n = self.window_size
+        if np is not None:
+            arr = np.asarray(values, dtype=np.float64)
+            if len(arr) < n:
+                empty = np.empty(0)
+                return empty, empty.copy(), empty.copy(), empty.copy()
+            if _rolling_stats is not None:
+                return _rolling_stats(arr, n)
+            windows = np.lib.stride_tricks.sliding_window_view(arr, n)
+            sums = windows.sum(axis=1)
+            return sums / n, windows.min(axis=1), windows.max(axis=1), sums
+
+        stats = [s for s in map(StreamProcessor(n).add_value, values) if s]
+        return ([s["mean"] for s in stats], [s["min"] for s in stats],
+                [s["max"] for s in stats], [s["sum"] for s in stats])
+
     def get_trend(self) -> str:
         """Analyze trend based on window statistics."""
         if len(self._window_stats) < 2:
             return "insufficient_data"
-        
-        recent_means = [s["mean"] for s in self._window_stats[-5:]]
+
+        recent_means = [s["mean"] for s in self._window_stats]
         if len(recent_means) < 2:
             return "insufficient_data"
         
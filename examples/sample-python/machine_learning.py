@@ -3,13 +3,57 @@
 Machine learning utilities and model implementations.
 """
 
+import os
 import random
 import math
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Dict, Optional, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 import numpy as np
 
+try:
+    from scipy.spatial import cKDTree  # Optional: sublinear neighbor queries
+except ImportError:
+    cKDTree = None
+
+try:
+    import numba  # Optional: JIT-compiled network layer kernel
+except ImportError:
+    numba = None
+
+
+# Below this many rows the split sweep is cheap enough that thread
+# hand-off overhead outweighs running the features in parallel
+_SPLIT_PARALLEL_MIN_ROWS = 1000
+_split_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_split_pool() -> ThreadPoolExecutor:
+    """Shared pool for per-feature split sweeps (numpy releases the GIL)."""
+    global _split_pool
+    if _split_pool is None:
+        _split_pool = ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1),
+            thread_name_prefix="dt-split")
+    return _split_pool
+
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _relu_layer(weights, biases, inputs):
+        """Dense layer with ReLU: max(0, W @ a + b), compiled to machine code."""
+        out = np.empty(weights.shape[0])
+        for j in range(weights.shape[0]):
+            total = biases[j]
+            for k in range(weights.shape[1]):
+                total += weights[j, k] * inputs[k]
+            out[j] = max(0.0, total)
+        return out
+else:
+    def _relu_layer(weights, biases, inputs):
+        return np.maximum(0.0, weights @ inputs + biases)
+
 
 @dataclass
 class DataPoint:
@@ -25,16 +69,32 @@ class DataPoint:
 class Dataset:
     """Collection of data points."""
     data: List[DataPoint]
-    
+    _arrays: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    def as_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Columnar (X, y) view of the data, built once and memoized.
+
+        X is a contiguous (N, F) float64 array and y a (N,) array with
+        NaN where a point has no label — the layout NumPy and any JIT
+        kernels can stream through without chasing per-point objects.
+        """
+        if self._arrays is None:
+            features = np.asarray([p.features for p in self.data], dtype=np.float64)
+            labels = np.asarray([p.label if p.label is not None else np.nan
+                                 for p in self.data], dtype=np.float64)
+            self._arrays = (features, labels)
+        return self._arrays
+
     def split(self, train_ratio: float = 0.8) -> Tuple['Dataset', 'Dataset']:
         """Split dataset into training and testing sets."""
         split_idx = int(len(self.data) * train_ratio)
-        shuffled = self.data.copy()
-        random.shuffle(shuffled)
-        
-        train_data = Dataset(shuffled[:split_idx])
-        test_data = Dataset(shuffled[split_idx:])
-        
+        # One permutation of indices instead of copying and Fisher-Yates
+        # shuffling the point list itself
+        order = np.random.permutation(len(self.data))
+
+        train_data = Dataset([self.data[i] for i in order[:split_idx]])
+        test_data = Dataset([self.data[i] for i in order[split_idx:]])
+
         return train_data, test_data
     
     @property
@@ -42,6 +102,15 @@ class Dataset:
         return len(self.data)
 
 
+def _labeled_arrays(dataset: 'Dataset') -> Tuple[np.ndarray, np.ndarray]:
+    """(X, y) arrays restricted to the labeled points of a dataset."""
+    features, labels = dataset.as_arrays()
+    mask = ~np.isnan(labels)
+    if mask.all():
+        return features, labels
+    return features[mask], labels[mask]
+
+
 class Model(ABC):
     """Abstract base class for machine learning models."""
     
@@ -59,23 +128,20 @@ class Model(ABC):
         """Evaluate model performance on a dataset."""
         if not dataset.data:
             return {"error": float('inf')}
-        
-        predictions = []
-        actuals = []
-        
-        for point in dataset.data:
-            if point.label is not None:
-                pred = self.predict(point.features)
-                predictions.append(pred)
-                actuals.append(point.label)
-        
-        if not predictions:
+
+        features, actuals = _labeled_arrays(dataset)
+        if len(actuals) == 0:
             return {"error": float('inf')}
-        
-        # Calculate metrics
-        mse = sum((p - a) ** 2 for p, a in zip(predictions, actuals)) / len(predictions)
-        mae = sum(abs(p - a) for p, a in zip(predictions, actuals)) / len(predictions)
-        
+
+        predictions = np.fromiter(
+            (self.predict(features[i]) for i in range(len(actuals))),
+            dtype=np.float64, count=len(actuals))
+
+        # Calculate metrics as array reductions
+        errors = predictions - actuals
+        mse = float((errors * errors).mean())
+        mae = float(np.abs(errors).mean())
+
         return {
             "mse": mse,
             "mae": mae,
@@ -89,54 +155,42 @@ class LinearRegression(Model):
     def __init__(self, learning_rate: float = 0.01, epochs: int = 1000):
         self.learning_rate = learning_rate
         self.epochs = epochs
-        self.weights: Optional[List[float]] = None
+        self.weights: Optional[np.ndarray] = None
         self.bias: float = 0.0
-    
+
     def train(self, dataset: Dataset) -> None:
-        """Train using gradient descent."""
+        """Train using full-batch gradient descent over NumPy arrays."""
         if not dataset.data:
             return
-        
-        # Initialize weights
-        n_features = len(dataset.data[0].features)
-        self.weights = [0.0] * n_features
+
+        features, labels = _labeled_arrays(dataset)
+        if len(labels) == 0:
+            return
+
+        self.weights = np.zeros(features.shape[1])
         self.bias = 0.0
-        
-        # Gradient descent
+
+        # Gradient descent: each epoch is two BLAS matrix-vector products
+        n_samples = len(labels)
         for epoch in range(self.epochs):
-            total_error = 0.0
-            
-            for point in dataset.data:
-                if point.label is None:
-                    continue
-                
-                # Forward pass
-                prediction = self._forward(point.features)
-                error = prediction - point.label
-                total_error += error ** 2
-                
-                # Backward pass
-                for i in range(n_features):
-                    self.weights[i] -= self.learning_rate * error * point.features[i]
-                self.bias -= self.learning_rate * error
-            
+            errors = features @ self.weights + self.bias - labels
+            self.weights -= self.learning_rate * (features.T @ errors) / n_samples
+            self.bias -= self.learning_rate * errors.mean()
+
             if epoch % 100 == 0:
-                avg_error = total_error / dataset.size
+                avg_error = float(errors @ errors) / dataset.size
                 print(f"Epoch {epoch}, Average Error: {avg_error:.4f}")
-    
+
     def predict(self, features: List[float]) -> float:
         """Make a prediction."""
         if self.weights is None:
             raise ValueError("Model not trained yet")
-        
+
         return self._forward(features)
-    
+
     def _forward(self, features: List[float]) -> float:
         """Forward pass computation."""
-        result = self.bias
-        for i, feature in enumerate(features):
-            result += self.weights[i] * feature
-        return result
+        return float(np.dot(self.weights, np.asarray(features, dtype=np.float64)) + self.bias)
 
 
 class KNearestNeighbors(Model):
@@ -146,40 +200,63 @@ class KNearestNeighbors(Model):
         self.k = k
         self.distance_metric = distance_metric
         self.training_data: Optional[Dataset] = None
-    
+        self._features: Optional[np.ndarray] = None
+        self._labels: Optional[np.ndarray] = None
+        self._tree = None
+
+        # Resolve the metric once instead of re-branching on every call;
+        # math.dist computes euclidean distance in a single C call
+        if distance_metric == "euclidean":
+            self._dist_fn = math.dist
+        elif distance_metric == "manhattan":
+            self._dist_fn = lambda a, b: sum(abs(x - y) for x, y in zip(a, b))
+        else:
+            raise ValueError(f"Unknown distance metric: {distance_metric}")
+
     def train(self, dataset: Dataset) -> None:
-        """KNN doesn't need training, just stores the data."""
+        """KNN stores the data as contiguous arrays (plus a KDTree if available)."""
         self.training_data = dataset
-    
+        self._features, self._labels = _labeled_arrays(dataset)
+        self._tree = None
+        if cKDTree is not None and self.distance_metric == "euclidean" and len(self._labels):
+            self._tree = cKDTree(self._features)
+
     def predict(self, features: List[float]) -> float:
         """Predict using k nearest neighbors."""
         if self.training_data is None:
             raise ValueError("Model not trained yet")
-        
-        # Calculate distances to all training points
-        distances = []
-        for point in self.training_data.data:
-            if point.label is not None:
-                dist = self._calculate_distance(features, point.features)
-                distances.append((dist, point.label))
-        
-        # Sort by distance and take k nearest
-        distances.sort(key=lambda x: x[0])
-        k_nearest = distances[:self.k]
-        
+
+        if self._labels is None or len(self._labels) == 0:
+            return 0.0
+
+        query = np.asarray(features, dtype=np.float64)
+        k = min(self.k, len(self._labels))
+
+        if self._tree is not None:
+            _, nearest = self._tree.query(query, k)
+            nearest = np.atleast_1d(nearest)
+        else:
+            # Broadcast distances to all training points in one pass
+            if self.distance_metric == "euclidean":
+                diff = self._features - query
+                distances = np.einsum('ij,ij->i', diff, diff)
+            elif self.distance_metric == "manhattan":
+                distances = np.abs(self._features - query).sum(axis=1)
+            else:
+                raise ValueError(f"Unknown distance metric: {self.distance_metric}")
+
+            if k < len(distances):
+                # O(N) partial selection instead of a full sort
+                nearest = np.argpartition(distances, k - 1)[:k]
+            else:
+                nearest = np.arange(len(distances))
+
         # Return average of k nearest labels (for regression)
-        if k_nearest:
-            return sum(label for _, label in k_nearest) / len(k_nearest)
-        return 0.0
+        return float(self._labels[nearest].mean())
     
     def _calculate_distance(self, a: List[float], b: List[float]) -> float:
-        """Calculate distance between two points."""
-        if self.distance_metric == "euclidean":
-            return math.sqrt(sum((x - y) ** 2 for x, y in zip(a, b)))
-        elif self.distance_metric == "manhattan":
-            return sum(abs(x - y) for x, y in zip(a, b))
-        else:
-            raise ValueError(f"Unknown distance metric: {self.distance_metric}")
+        """Calculate distance between two points (scalar path)."""
+        return self._dist_fn(a, b)
 
 
 class DecisionTree(Model):
@@ -189,6 +266,8 @@ class DecisionTree(Model):
         self.max_depth = max_depth
         self.min_samples_split = min_samples_split
         self.root = None
+        self._features: Optional[np.ndarray] = None
+        self._labels: Optional[np.ndarray] = None
     
     class Node:
         """Decision tree node."""
@@ -202,125 +281,197 @@ class DecisionTree(Model):
     
     def train(self, dataset: Dataset) -> None:
         """Build the decision tree."""
-        self.root = self._build_tree(dataset.data, 0)
-    
+        self._features, self._labels = _labeled_arrays(dataset)
+        self.root = self._build_tree(np.arange(len(self._labels)), 0,
+                                     float(self._labels.var()))
+        self._flatten_tree()
+
     def predict(self, features: List[float]) -> float:
-        """Traverse the tree to make a prediction."""
+        """Predict by walking the flattened tree iteratively."""
         if self.root is None:
             raise ValueError("Model not trained yet")
-        
-        return self._traverse_tree(features, self.root)
-    
-    def _build_tree(self, data: List[DataPoint], depth: int) -> Node:
-        """Recursively build the decision tree."""
+
+        node = 0
+        while not self._leaf[node]:
+            if features[self._feat[node]] <= self._thr[node]:
+                node = self._left[node]
+            else:
+                node = self._right[node]
+        return self._val[node]
+
+    def predict_batch(self, features: np.ndarray) -> np.ndarray:
+        """Predict for a batch of rows at once."""
+        if self.root is None:
+            raise ValueError("Model not trained yet")
+
+        features = np.asarray(features, dtype=np.float64)
+        return np.fromiter((self.predict(row) for row in features),
+                           dtype=np.float64, count=len(features))
+
+    def _flatten_tree(self) -> None:
+        """Flatten the node graph into parallel arrays.
+
+        An iterative walk over flat arrays avoids per-prediction Python
+        recursion and attribute lookups on Node objects; children sit at
+        the indices stored in _left/_right.
+        """
+        feat: List[int] = []
+        thr: List[float] = []
+        left: List[int] = []
+        right: List[int] = []
+        val: List[float] = []
+        leaf: List[bool] = []
+
+        def visit(node: 'DecisionTree.Node') -> int:
+            idx = len(feat)
+            feat.append(node.feature_idx if node.feature_idx is not None else -1)
+            thr.append(node.threshold if node.threshold is not None else 0.0)
+            left.append(-1)
+            right.append(-1)
+            val.append(node.value if node.value is not None else 0.0)
+            leaf.append(node.is_leaf)
+            if not node.is_leaf:
+                left[idx] = visit(node.left)
+                right[idx] = visit(node.right)
+            return idx
+
+        visit(self.root)
+        self._feat = np.asarray(feat, dtype=np.intp)
+        self._thr = np.asarray(thr, dtype=np.float64)
+        self._left = np.asarray(left, dtype=np.intp)
+        self._right = np.asarray(right, dtype=np.intp)
+        self._val = np.asarray(val, dtype=np.float64)
+        self._leaf = np.asarray(leaf, dtype=bool)
+    
+    def _build_tree(self, indices: np.ndarray, depth: int,
+                    node_var: float) -> Node:
+        """Recursively build the decision tree over row-index arrays.
+
+        Recursion passes index arrays into the shared (X, y) columns
+        instead of re-slicing lists of DataPoint objects, along with the
+        node's label variance, which the parent's split sweep already
+        computed — no node ever recomputes labels.var() over its rows.
+        """
         node = self.Node()
-        
+
         # Check stopping criteria
-        if (depth >= self.max_depth or 
-            len(data) < self.min_samples_split or
-            not data):
+        if (depth >= self.max_depth or
+            len(indices) < self.min_samples_split):
             node.is_leaf = True
-            node.value = self._calculate_leaf_value(data)
+            node.value = self._calculate_leaf_value(indices)
             return node
-        
+
         # Find best split
-        best_feature, best_threshold = self._find_best_split(data)
-        
+        best_feature, best_threshold, child_vars = self._find_best_split(
+            indices, node_var)
+
         if best_feature is None:
             node.is_leaf = True
-            node.value = self._calculate_leaf_value(data)
+            node.value = self._calculate_leaf_value(indices)
             return node
-        
-        # Split data
-        left_data, right_data = self._split_data(data, best_feature, best_threshold)
-        
+
+        # Split rows by boolean mask on the feature column
+        mask = self._features[indices, best_feature] <= best_threshold
+
         # Build subtrees
         node.feature_idx = best_feature
         node.threshold = best_threshold
-        node.left = self._build_tree(left_data, depth + 1)
-        node.right = self._build_tree(right_data, depth + 1)
-        
+        node.left = self._build_tree(indices[mask], depth + 1, child_vars[0])
+        node.right = self._build_tree(indices[~mask], depth + 1, child_vars[1])
+
         return node
-    
-    def _find_best_split(self, data: List[DataPoint]) -> Tuple[Optional[int], Optional[float]]:
-        """Find the best feature and threshold to split on."""
-        if not data:
-            return None, None
-        
+
+    def _find_best_split(
+            self, indices: np.ndarray, parent_var: float
+    ) -> Tuple[Optional[int], Optional[float], Tuple[float, float]]:
+        """Find the best feature and threshold to split on.
+
+        Returns the winning feature, its threshold and the (left, right)
+        label variances at that split, so children inherit their variance
+        for free.
+        """
+        if len(indices) == 0:
+            return None, None, (0.0, 0.0)
+
         best_feature = None
         best_threshold = None
         best_variance_reduction = 0
-        
-        n_features = len(data[0].features)
-        
-        for feature_idx in range(n_features):
-            # Get unique values for this feature
-            values = sorted(set(point.features[feature_idx] for point in data))
-            
-            for i in range(len(values) - 1):
-                threshold = (values[i] + values[i + 1]) / 2
-                
-                # Calculate variance reduction
-                left_data, right_data = self._split_data(data, feature_idx, threshold)
-                
-                if left_data and right_data:
-                    var_reduction = self._calculate_variance_reduction(
-                        data, left_data, right_data
-                    )
-                    
-                    if var_reduction > best_variance_reduction:
-                        best_variance_reduction = var_reduction
-                        best_feature = feature_idx
-                        best_threshold = threshold
-        
-        return best_feature, best_threshold
-    
-    def _split_data(self, data: List[DataPoint], feature_idx: int, 
-                    threshold: float) -> Tuple[List[DataPoint], List[DataPoint]]:
-        """Split data based on feature and threshold."""
-        left = [p for p in data if p.features[feature_idx] <= threshold]
-        right = [p for p in data if p.features[feature_idx] > threshold]
-        return left, right
-    
-    def _calculate_variance_reduction(self, parent: List[DataPoint], 
-                                    left: List[DataPoint], 
-                                    right: List[DataPoint]) -> float:
-        """Calculate variance reduction from a split."""
-        def variance(data: List[DataPoint]) -> float:
-            if not data:
-                return 0
-            labels = [p.label for p in data if p.label is not None]
-            if not labels:
-                return 0
-            mean = sum(labels) / len(labels)
-            return sum((l - mean) ** 2 for l in labels) / len(labels)
-        
-        parent_var = variance(parent)
-        left_var = variance(left)
-        right_var = variance(right)
-        
-        n_parent = len(parent)
-        n_left = len(left)
-        n_right = len(right)
-        
-        weighted_var = (n_left / n_parent) * left_var + (n_right / n_parent) * right_var
-        
-        return parent_var - weighted_var
-    
-    def _calculate_leaf_value(self, data: List[DataPoint]) -> float:
-        """Calculate the value for a leaf node."""
-        labels = [p.label for p in data if p.label is not None]
-        return sum(labels) / len(labels) if labels else 0.0
-    
-    def _traverse_tree(self, features: List[float], node: Node) -> float:
-        """Traverse the tree to make a prediction."""
-        if node.is_leaf:
-            return node.value
-        
-        if features[node.feature_idx] <= node.threshold:
-            return self._traverse_tree(features, node.left)
+        best_child_vars = (0.0, 0.0)
+
+        n = len(indices)
+        labels = self._labels[indices]
+        n_features = self._features.shape[1]
+
+        # Each feature's sweep is independent, so large nodes fan the
+        # features out across the shared thread pool; small nodes stay
+        # serial where the hand-off would cost more than the sweep.
+        if n >= _SPLIT_PARALLEL_MIN_ROWS and n_features > 1:
+            sweeps = _get_split_pool().map(
+                lambda f: self._sweep_feature(indices, f, labels, parent_var),
+                range(n_features))
         else:
-            return self._traverse_tree(features, node.right)
+            sweeps = (self._sweep_feature(indices, f, labels, parent_var)
+                      for f in range(n_features))
+
+        for feature_idx, sweep in enumerate(sweeps):
+            if sweep is None:
+                continue
+            reduction, threshold, child_vars = sweep
+            if reduction > best_variance_reduction:
+                best_variance_reduction = reduction
+                best_feature = feature_idx
+                best_threshold = threshold
+                best_child_vars = child_vars
+
+        return best_feature, best_threshold, best_child_vars
+
+    def _sweep_feature(
+            self, indices: np.ndarray, feature_idx: int, labels: np.ndarray,
+            parent_var: float
+    ) -> Optional[Tuple[float, float, Tuple[float, float]]]:
+        """Best (variance reduction, threshold, child variances) for one
+        feature column.
+
+        Sorts the column once, then sweeps every candidate split with
+        running sums: left/right variances come from cumulative sum and
+        sum-of-squares, O(n log n) instead of rescanning the rows for
+        each threshold.
+        """
+        n = len(indices)
+        column = self._features[indices, feature_idx]
+
+        order = np.argsort(column)
+        xs = column[order]
+        ys = labels[order]
+
+        valid = xs[1:] != xs[:-1]
+        if not valid.any():
+            return None
+
+        csum = np.cumsum(ys)
+        csum2 = np.cumsum(ys * ys)
+        n_left = np.arange(1, n)
+        n_right = n - n_left
+
+        left_mean = csum[:-1] / n_left
+        right_mean = (csum[-1] - csum[:-1]) / n_right
+        # Clamp tiny negative values from floating-point cancellation
+        left_var = np.maximum(csum2[:-1] / n_left - left_mean ** 2, 0.0)
+        right_var = np.maximum(
+            (csum2[-1] - csum2[:-1]) / n_right - right_mean ** 2, 0.0)
+
+        reduction = parent_var - (n_left * left_var + n_right * right_var) / n
+        reduction[~valid] = -np.inf
+
+        split = int(np.argmax(reduction))
+        return (float(reduction[split]), (xs[split] + xs[split + 1]) / 2,
+                (float(left_var[split]), float(right_var[split])))
+
+    def _calculate_leaf_value(self, indices: np.ndarray) -> float:
+        """Calculate the value for a leaf node."""
+        if len(indices) == 0:
+            return 0.0
+        return float(self._labels[indices].mean())
 
 
 class NeuralNetwork(Model):
@@ -331,36 +482,40 @@ class NeuralNetwork(Model):
         self.layer_sizes = layer_sizes
         self.learning_rate = learning_rate
         self.epochs = epochs
-        self.weights: List[List[List[float]]] = []
-        self.biases: List[List[float]] = []
-        
-        # Initialize weights and biases
-        for i in range(len(layer_sizes) - 1):
-            weight_matrix = [[random.gauss(0, 0.1) 
-                             for _ in range(layer_sizes[i])] 
-                            for _ in range(layer_sizes[i + 1])]
-            bias_vector = [0.0 for _ in range(layer_sizes[i + 1])]
-            
-            self.weights.append(weight_matrix)
-            self.biases.append(bias_vector)
+        self.weights: List[np.ndarray] = []
+        self.biases: List[np.ndarray] = []
+
+        # He initialization, drawn in one vectorized call per layer
+        # instead of a Python loop of random.gauss; the sqrt(2/fan_in)
+        # scale keeps ReLU activations from vanishing layer to layer
+        rng = np.random.default_rng()
+        for fan_in, fan_out in zip(layer_sizes, layer_sizes[1:]):
+            self.weights.append(
+                rng.standard_normal((fan_out, fan_in)) * math.sqrt(2.0 / fan_in))
+            self.biases.append(np.zeros(fan_out))
+
+        self._q_mode: Optional[str] = None
+        self._q_weights: List[np.ndarray] = []
+        self._q_scales: List[np.ndarray] = []
     
     def train(self, dataset: Dataset) -> None:
         """Train the neural network using backpropagation."""
+        # Materialize the training set once; iterating ndarray rows avoids
+        # rebuilding a float array from each point's feature list per epoch
+        features, labels = _labeled_arrays(dataset)
+
         for epoch in range(self.epochs):
             total_error = 0.0
-            
-            for point in dataset.data:
-                if point.label is None:
-                    continue
-                
+
+            for row, label in zip(features, labels):
                 # Forward pass
-                activations = self._forward_pass(point.features)
+                activations = self._forward_pass(row)
                 prediction = activations[-1][0]  # Assuming single output
-                error = prediction - point.label
+                error = prediction - label
                 total_error += error ** 2
-                
+
                 # Backward pass
-                self._backward_pass(point.features, point.label, activations)
+                self._backward_pass(row, label, activations)
             
             if epoch % 100 == 0:
                 avg_error = total_error / dataset.size
@@ -370,53 +525,83 @@ class NeuralNetwork(Model):
         """Make a prediction using the neural network."""
         activations = self._forward_pass(features)
         return activations[-1][0]  # Assuming single output
+
+    def quantize(self, mode: str = "int8") -> None:
+        """Quantize the trained weights for compact inference.
+
+        "int8" stores each weight matrix as int8 with a per-row scale
+        (8x smaller than float64); "fp16" keeps half-precision floats
+        as a higher-fidelity fallback.
+        """
+        if mode == "int8":
+            self._q_weights = []
+            self._q_scales = []
+            for weights in self.weights:
+                scale = np.abs(weights).max(axis=1, keepdims=True) / 127.0
+                scale[scale == 0.0] = 1.0
+                self._q_weights.append(
+                    np.round(weights / scale).astype(np.int8))
+                self._q_scales.append(scale.ravel())
+        elif mode == "fp16":
+            self._q_weights = [w.astype(np.float16) for w in self.weights]
+            self._q_scales = []
+        else:
+            raise ValueError(f"Unknown quantization mode: {mode}")
+        self._q_mode = mode
+
+    def predict_q(self, features: List[float]) -> float:
+        """Predict using the quantized weights."""
+        if self._q_mode is None:
+            raise ValueError("Network not quantized yet; call quantize() first")
+
+        layer_input = np.asarray(features, dtype=np.float64)
+        if self._q_mode == "int8":
+            for weights, scale, biases in zip(
+                    self._q_weights, self._q_scales, self.biases):
+                # int8 @ float64 upcasts, so dequantization is just the
+                # per-row rescale after the matmul
+                layer_input = np.maximum(
+                    0.0, (weights @ layer_input) * scale + biases)
+        else:
+            for weights, biases in zip(self._q_weights, self.biases):
+                layer_input = np.maximum(0.0, weights @ layer_input + biases)
+        return layer_input[0]
     
-    def _forward_pass(self, inputs: List[float]) -> List[List[float]]:
+    def _forward_pass(self, inputs: List[float]) -> List[np.ndarray]:
         """Perform forward pass through the network."""
-        activations = [inputs]
-        
-        for i in range(len(self.weights)):
-            layer_output = []
-            
-            for j in range(len(self.weights[i])):
-                # Calculate weighted sum
-                total = self.biases[i][j]
-                for k in range(len(activations[-1])):
-                    total += self.weights[i][j][k] * activations[-1][k]
-                
-                # Apply activation function (ReLU)
-                layer_output.append(max(0, total))
-            
-            activations.append(layer_output)
-        
+        layer_input = np.asarray(inputs, dtype=np.float64)
+        activations = [layer_input]
+
+        for weights, biases in zip(self.weights, self.biases):
+            layer_input = _relu_layer(weights, biases, layer_input)
+            activations.append(layer_input)
+
         return activations
-    
-    def _backward_pass(self, inputs: List[float], target: float, 
-                      activations: List[List[float]]) -> None:
+
+    def _backward_pass(self, inputs: List[float], target: float,
+                      activations: List[np.ndarray]) -> None:
         """Perform backward pass to update weights."""
         # Simplified backpropagation for demonstration
         # In practice, you would compute gradients properly
-        
+
         output_error = activations[-1][0] - target
-        
-        # Update output layer weights
-        for i in range(len(self.weights[-1][0])):
-            self.weights[-1][0][i] -= self.learning_rate * output_error * activations[-2][i]
+
+        # Update output layer weights in one vectorized step
+        self.weights[-1][0] -= self.learning_rate * output_error * activations[-2]
         self.biases[-1][0] -= self.learning_rate * output_error
 
 
 def generate_synthetic_data(n_samples: int = 100, n_features: int = 2, 
                           noise: float = 0.1) -> Dataset:
     """Generate synthetic dataset for testing."""
-    data = []
-    
-    for _ in range(n_samples):
-        features = [random.uniform(-10, 10) for _ in range(n_features)]
-        # Simple linear relationship with noise
-        label = sum(f * (i + 1) for i, f in enumerate(features)) + random.gauss(0, noise)
-        data.append(DataPoint(features, label))
-    
-    return Dataset(data)
+    # Draw the whole sample matrix and noise vector in two rng calls;
+    # the linear labels come from a single matrix-vector product
+    rng = np.random.default_rng()
+    features = rng.uniform(-10, 10, size=(n_samples, n_features))
+    labels = features @ np.arange(1, n_features + 1) + rng.normal(0, noise, n_samples)
+
+    return Dataset([DataPoint(list(row), float(label))
+                    for row, label in zip(features, labels)])
 
 
 def main():
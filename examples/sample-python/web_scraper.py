@@ -5,18 +5,51 @@ Web scraping utilities with various parsers and extractors.
 
 import re
 import asyncio
+from functools import lru_cache
 from typing import List, Dict, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 
+try:
+    # Optional: real HTML tokenizer — one linear scan instead of several
+    # backtracking regex passes over the page
+    from selectolax.parser import HTMLParser as _DOMParser
+except ImportError:
+    _DOMParser = None
+
+try:
+    import aiohttp  # Optional: real HTTP fetching with a pooled session
+except ImportError:
+    aiohttp = None
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Precompiled patterns shared by the extractors (hot per-page paths)
+_TITLE_RE = re.compile(r'<title>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_HREF_RE = re.compile(r'<a[^>]+href=["\']([^"\']+)["\']', re.IGNORECASE)
+_IMG_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE)
+# One alternation strips script blocks, style blocks and bare tags in a
+# single scan of the page instead of three substitution passes
+_STRIP_RE = re.compile(
+    r'<script\b[^>]*>.*?</script>|<style\b[^>]*>.*?</style>|<[^>]+>',
+    re.IGNORECASE | re.DOTALL)
+_META_RE = re.compile(r'<meta\s+([^>]+)>', re.IGNORECASE)
+_META_NAME_RE = re.compile(r'(?:name|property)=["\']([^"\']+)["\']')
+_META_CONTENT_RE = re.compile(r'content=["\']([^"\']+)["\']')
+
+
+@lru_cache(maxsize=8192)
+def _parse_url(url: str):
+    """Memoized urlparse — the same URLs are parsed repeatedly per crawl."""
+    return urlparse(url)
+
+
 @dataclass
 class WebPage:
     """Represents a scraped web page."""
@@ -36,24 +69,22 @@ class URLValidator:
     def is_valid_url(url: str) -> bool:
         """Check if URL is valid."""
         try:
-            result = urlparse(url)
+            result = _parse_url(url)
             return all([result.scheme, result.netloc])
-        except:
+        except (ValueError, TypeError):
             return False
-    
+
     @staticmethod
     def normalize_url(url: str) -> str:
         """Normalize URL by removing fragments and converting to lowercase."""
-        parsed = urlparse(url.lower())
+        parsed = _parse_url(url.lower())
         # Remove fragment and rebuild URL
         return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-    
+
     @staticmethod
     def is_same_domain(url1: str, url2: str) -> bool:
         """Check if two URLs belong to the same domain."""
-        domain1 = urlparse(url1).netloc
-        domain2 = urlparse(url2).netloc
-        return domain1 == domain2
+        return _parse_url(url1).netloc == _parse_url(url2).netloc
 
 
 class HTMLParser:
@@ -61,66 +92,102 @@ class HTMLParser:
     
     def __init__(self):
         self.url_validator = URLValidator()
-    
+
+    def parse(self, html: str, base_url: str) -> WebPage:
+        """Parse a page into a WebPage in a single pass.
+
+        With selectolax installed the HTML is tokenized once and title,
+        links, images, text and metadata all come from the same tree;
+        otherwise this falls back to the per-element regex extractors.
+        """
+        page = WebPage(url=base_url)
+
+        if _DOMParser is None:
+            page.title = self.extract_title(html)
+            page.content = self.extract_text(html)
+            page.links = self.extract_links(html, base_url)
+            page.images = self.extract_images(html, base_url)
+            page.metadata = self.extract_metadata(html)
+            return page
+
+        tree = _DOMParser(html)
+
+        title_node = tree.css_first('title')
+        page.title = title_node.text().strip() if title_node else None
+
+        seen_links = set()
+        for anchor in tree.css('a'):
+            href = anchor.attributes.get('href')
+            if href:
+                absolute = urljoin(base_url, href)
+                if absolute not in seen_links and self.url_validator.is_valid_url(absolute):
+                    seen_links.add(absolute)
+        page.links = list(seen_links)
+
+        seen_images = set()
+        for image in tree.css('img'):
+            src = image.attributes.get('src')
+            if src:
+                seen_images.add(urljoin(base_url, src))
+        page.images = list(seen_images)
+
+        for meta in tree.css('meta'):
+            name = meta.attributes.get('name') or meta.attributes.get('property')
+            content = meta.attributes.get('content')
+            if name and content:
+                page.metadata[name] = content
+
+        tree.strip_tags(['script', 'style'])
+        body = tree.body
+        if body is not None:
+            page.content = ' '.join(body.text(separator=' ').split())
+
+        return page
+
     def extract_title(self, html: str) -> Optional[str]:
         """Extract page title from HTML."""
-        match = re.search(r'<title>(.*?)</title>', html, re.IGNORECASE | re.DOTALL)
+        match = _TITLE_RE.search(html)
         return match.group(1).strip() if match else None
-    
+
     def extract_links(self, html: str, base_url: str) -> List[str]:
         """Extract all links from HTML."""
-        links = []
-        # Find all anchor tags
-        href_pattern = r'<a[^>]+href=["\']([^"\']+)["\']'
-        matches = re.findall(href_pattern, html, re.IGNORECASE)
-        
-        for match in matches:
+        # Stream anchor matches straight into a set — no intermediate
+        # list to build and rehash afterwards
+        links = set()
+        for match in _HREF_RE.finditer(html):
             # Convert relative URLs to absolute
-            absolute_url = urljoin(base_url, match)
-            if self.url_validator.is_valid_url(absolute_url):
-                links.append(absolute_url)
-        
-        return list(set(links))  # Remove duplicates
+            absolute_url = urljoin(base_url, match.group(1))
+            if absolute_url not in links and self.url_validator.is_valid_url(absolute_url):
+                links.add(absolute_url)
+
+        return list(links)
     
     def extract_images(self, html: str, base_url: str) -> List[str]:
         """Extract all image URLs from HTML."""
-        images = []
+        images = set()
         # Find img tags
-        img_pattern = r'<img[^>]+src=["\']([^"\']+)["\']'
-        matches = re.findall(img_pattern, html, re.IGNORECASE)
-        
-        for match in matches:
-            absolute_url = urljoin(base_url, match)
-            images.append(absolute_url)
-        
-        return list(set(images))
+        for match in _IMG_RE.finditer(html):
+            images.add(urljoin(base_url, match.group(1)))
+
+        return list(images)
     
     def extract_text(self, html: str) -> str:
         """Extract plain text from HTML."""
-        # Remove script and style elements
-        html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', ' ', html)
-        
-        # Clean up whitespace
-        text = ' '.join(text.split())
-        
-        return text
+        # Drop script/style blocks and tags in one pass, then clean up
+        # whitespace
+        return ' '.join(_STRIP_RE.sub(' ', html).split())
     
     def extract_metadata(self, html: str) -> Dict[str, str]:
         """Extract metadata from HTML meta tags."""
         metadata = {}
         
         # Find all meta tags
-        meta_pattern = r'<meta\s+([^>]+)>'
-        matches = re.findall(meta_pattern, html, re.IGNORECASE)
-        
+        matches = _META_RE.findall(html)
+
         for match in matches:
             # Extract name/property and content
-            name_match = re.search(r'(?:name|property)=["\']([^"\']+)["\']', match)
-            content_match = re.search(r'content=["\']([^"\']+)["\']', match)
+            name_match = _META_NAME_RE.search(match)
+            content_match = _META_CONTENT_RE.search(match)
             
             if name_match and content_match:
                 metadata[name_match.group(1)] = content_match.group(1)
@@ -129,27 +196,62 @@ class HTMLParser:
 
 
 class WebScraper:
-    """Main web scraper class."""
-    
-    def __init__(self, max_depth: int = 2, same_domain_only: bool = True):
+    """Main web scraper class.
+
+    Use as an async context manager to fetch pages over a shared aiohttp
+    session (one pooled connector for the whole crawl); without aiohttp,
+    or outside a context, fetches are simulated.
+    """
+
+    def __init__(self, max_depth: int = 2, same_domain_only: bool = True,
+                 max_concurrency: int = 10):
         self.max_depth = max_depth
         self.same_domain_only = same_domain_only
+        self.max_concurrency = max_concurrency
         self.parser = HTMLParser()
         self.validator = URLValidator()
         self._visited_urls: Set[str] = set()
         self._scraped_pages: List[WebPage] = []
-    
+        # Caps in-flight fetches; recursion can otherwise fan out into
+        # thousands of simultaneous coroutines on link-dense sites
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session = None
+
+    async def __aenter__(self) -> 'WebScraper':
+        if aiohttp is not None and self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency))
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     async def scrape_page(self, url: str) -> Optional[WebPage]:
-        """Scrape a single page (simulated)."""
+        """Scrape a single page."""
         if url in self._visited_urls:
             return None
-        
+
         self._visited_urls.add(url)
         logger.info(f"Scraping: {url}")
-        
-        # Simulate fetching HTML content
-        await asyncio.sleep(0.1)  # Simulate network delay
-        
+
+        if self._session is not None:
+            async with self._semaphore:
+                try:
+                    async with self._session.get(url) as response:
+                        html = await response.text()
+                except aiohttp.ClientError as e:
+                    logger.warning(f"Fetch failed for {url}: {e}")
+                    return None
+            page = self.parser.parse(html, url)
+            self._scraped_pages.append(page)
+            return page
+
+        async with self._semaphore:
+            # Simulate fetching HTML content
+            await asyncio.sleep(0.1)  # Simulate network delay
+
         # Simulated HTML content
         html = f"""
         <html>
@@ -168,14 +270,9 @@ class WebScraper:
         </html>
         """
         
-        # Parse the page
-        page = WebPage(url=url)
-        page.title = self.parser.extract_title(html)
-        page.content = self.parser.extract_text(html)
-        page.links = self.parser.extract_links(html, url)
-        page.images = self.parser.extract_images(html, url)
-        page.metadata = self.parser.extract_metadata(html)
-        
+        # Parse the page (single tokenization pass)
+        page = self.parser.parse(html, url)
+
         self._scraped_pages.append(page)
         return page
     
@@ -240,11 +337,33 @@ class LinkChecker:
             return url, "200 OK"
     
     async def check_links(self, urls: List[str]) -> Dict[str, str]:
-        """Check multiple links concurrently."""
-        tasks = [self.check_link(url) for url in urls]
-        results = await asyncio.gather(*tasks)
-        
-        self._results = dict(results)
+        """Check multiple links concurrently.
+
+        Invalid URLs are rejected synchronously and duplicates are
+        checked once by normalized form, so only the unique valid set
+        consumes network tasks.
+        """
+        results: Dict[str, str] = {}
+        normalized_of: Dict[str, str] = {}
+        unique: Dict[str, str] = {}  # normalized URL -> representative original
+
+        for url in urls:
+            if not URLValidator.is_valid_url(url):
+                results[url] = "Invalid URL"
+                continue
+            normalized = URLValidator.normalize_url(url)
+            normalized_of[url] = normalized
+            unique.setdefault(normalized, url)
+
+        checked = await asyncio.gather(
+            *(self.check_link(representative) for representative in unique.values()))
+        status_by_norm = {normalized: status
+                          for normalized, (_, status) in zip(unique, checked)}
+
+        for url, normalized in normalized_of.items():
+            results[url] = status_by_norm[normalized]
+
+        self._results = results
         return self._results
     
     def get_broken_links(self) -> List[str]:
@@ -256,12 +375,13 @@ class LinkChecker:
 # Example usage
 async def main():
     """Example of using the web scraper."""
-    scraper = WebScraper(max_depth=1)
-    
-    # Scrape a website
-    start_url = "https://example.com"
-    pages = await scraper.scrape_website(start_url)
-    
+    # The context manager owns the shared HTTP session (when aiohttp is
+    # installed); without it the scraper falls back to simulated fetches
+    async with WebScraper(max_depth=1) as scraper:
+        # Scrape a website
+        start_url = "https://example.com"
+        pages = await scraper.scrape_website(start_url)
+
     print(f"Scraped {len(pages)} pages")
     for page in pages:
         print(f"\nPage: {page.url}")